@@ -32,6 +32,7 @@ from __future__ import annotations
 import os
 import shutil
 import subprocess
+import sys
 from dataclasses import dataclass
 
 import aws_cdk as cdk
@@ -59,7 +60,8 @@ class _LocalPipBundler:
       2. Copy contracts/ package from repo root (shared Pydantic models)
       3. Run pip install -r requirements.txt into output_dir
          (targeting manylinux2014_x86_64 / cp311 to match the Lambda runtime)
-      4. Return True on success, False to fall back to Docker
+      4. Precompile the bundle to bytecode (see _compile_bytecode)
+      5. Return True on success, False to fall back to Docker
     """
 
     def __init__(self, service_path: str) -> None:
@@ -118,6 +120,7 @@ class _LocalPipBundler:
                     ],
                     check=True,
                 )
+            _compile_bytecode(output_dir)
             return True
         except Exception:  # noqa: BLE001
             return False
@@ -201,17 +204,85 @@ class _PackagedLocalBundler:
                     ],
                     check=True,
                 )
+            _compile_bytecode(output_dir)
             return True
         except Exception:  # noqa: BLE001
             return False
 
 
+@jsii.implements(cdk.ILocalBundling)
+class _LayerLocalBundler:
+    """
+    Local bundling for the nova_common layer.
+
+    deploy.sh installs the layer's dependencies into the source directory;
+    this copies that tree into the asset staging directory and precompiles
+    it there, so bytecode never lands next to the git-tracked nova_common
+    sources (where an unchecked-hash .pyc would shadow local edits).
+    """
+
+    def __init__(self, layer_path: str) -> None:
+        self._layer_path = layer_path
+
+    def try_bundle(self, output_dir: str, *, image: object = None, **kwargs: object) -> bool:
+        try:
+            shutil.copytree(
+                self._layer_path,
+                output_dir,
+                dirs_exist_ok=True,
+                ignore=_LocalPipBundler._ignore_junk,
+            )
+            _compile_bytecode(output_dir)
+            return True
+        except Exception:  # noqa: BLE001
+            return False
+
+
+def _compile_bytecode(output_dir: str) -> None:
+    """
+    Precompile every module in the bundle so Lambda skips compilation on import.
+
+    /var/task is read-only at runtime, so a bundle without bytecode is
+    recompiled in memory on every cold start. unchecked-hash .pyc files are
+    used regardless of source mtime, which the asset zip does not preserve.
+    Sources are kept alongside so tracebacks stay readable. -f forces a
+    rewrite of the timestamp-mode .pyc files pip install -t already left
+    for the dependencies, which would otherwise be treated as up to date.
+
+    Skipped when the synth interpreter is not the Lambda runtime version —
+    bytecode for another minor version would be ignored at import anyway.
+    The Docker fallback always compiles (its image is the runtime's).
+    """
+    if sys.version_info[:2] != (3, 11):
+        return
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "compileall",
+            "-q",
+            "-f",
+            "-j",
+            "0",
+            "--invalidation-mode",
+            "unchecked-hash",
+            output_dir,
+        ],
+        check=True,
+    )
+
+
 # Default Lambda settings — tuned for Nova Cat's low-throughput, cost-aware profile.
 _DEFAULT_MEMORY_MB = 256
 _DEFAULT_TIMEOUT = cdk.Duration.seconds(30)
 _PYTHON_RUNTIME = lambda_.Runtime.PYTHON_3_11
 _LOG_RETENTION = logs.RetentionDays.THREE_MONTHS
 
+# Local build/test debris excluded from zip asset sources. Keeps the asset
+# hash content-addressed: running pytest or opening a directory in Finder
+# must not change the hash and force a re-upload on the next deploy.
+_ASSET_EXCLUDE = ["__pycache__", "*.pyc", ".pytest_cache", ".mypy_cache", ".DS_Store"]
+
 
 @dataclass
 class _FunctionSpec:
@@ -420,11 +491,32 @@ class NovaCatCompute(Construct):
         # ------------------------------------------------------------------
         # nova_common Lambda Layer
         # ------------------------------------------------------------------
+        # Bytecode precompile step — the Docker equivalent of _compile_bytecode.
+        _docker_compile = (
+            "python -m compileall -q -f -j 0 --invalidation-mode unchecked-hash /asset-output"
+        )
+
+        layer_path = os.path.join(self._services_root, "nova_common_layer")
         nova_common_layer = lambda_.LayerVersion(
             self,
             "NovaCommonLayer",
             layer_version_name=f"{env_prefix}-nova-common",
-            code=lambda_.Code.from_asset(os.path.join(self._services_root, "nova_common_layer")),
+            code=lambda_.Code.from_asset(
+                layer_path,
+                asset_hash_type=cdk.AssetHashType.SOURCE,
+                exclude=_ASSET_EXCLUDE,
+                bundling=cdk.BundlingOptions(
+                    image=_PYTHON_RUNTIME.bundling_image,
+                    command=[
+                        "bash",
+                        "-c",
+                        "cp -r /asset-input/. /asset-output && "
+                        "find /asset-output -type d -name __pycache__ -prune -exec rm -rf {} + && "
+                        f"{_docker_compile}",
+                    ],
+                    local=_LayerLocalBundler(layer_path),
+                ),
+            ),
             compatible_runtimes=[_PYTHON_RUNTIME],
             description="Nova Cat shared utilities: Powertools Logger, Tracer, configure_logging",
         )
@@ -441,7 +533,6 @@ class NovaCatCompute(Construct):
         _docker_contracts = (
             "if [ -d /contracts ]; then cp -r /contracts /asset-output/contracts; fi"
         )
-
         for name, spec in _FUNCTION_SPECS.items():
             service_path = os.path.join(self._services_root, spec.service_dir)
             if spec.package_name:
@@ -457,14 +548,16 @@ class NovaCatCompute(Construct):
                     f'cp "$f" /asset-output/{pkg}/; done && '
                     f"{_docker_contracts} && "
                     f"if [ -f requirements.txt ]; then "
-                    f"pip install -r requirements.txt -t /asset-output --quiet; fi"
+                    f"pip install -r requirements.txt -t /asset-output --quiet; fi && "
+                    f"{_docker_compile}"
                 )
                 local_bundler: cdk.ILocalBundling = _PackagedLocalBundler(service_path, pkg)
             else:
                 docker_cmd = (
                     "pip install -r requirements.txt -t /asset-output && "
                     "cp -r . /asset-output && "
-                    f"{_docker_contracts}"
+                    f"{_docker_contracts} && "
+                    f"{_docker_compile}"
                 )
                 local_bundler = _LocalPipBundler(service_path)
 
@@ -477,6 +570,7 @@ class NovaCatCompute(Construct):
                 code=lambda_.Code.from_asset(
                     service_path,
                     asset_hash_type=cdk.AssetHashType.SOURCE,
+                    exclude=_ASSET_EXCLUDE,
                     bundling=cdk.BundlingOptions(
                         image=_PYTHON_RUNTIME.bundling_image,
                         command=["bash", "-c", docker_cmd],
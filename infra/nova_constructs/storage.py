@@ -12,14 +12,19 @@ Design decisions:
   - PAY_PER_REQUEST billing: expected dataset is small (<250 GB, <1000 novae).
     Cost-aware architecture; no need for provisioned capacity.
   - BEST_EFFORT PITR disabled by default (cost); enable in prod via parameter.
+  - Tables use the dynamodb.Table construct, not TableV2. TableV2 synthesizes
+    AWS::DynamoDB::GlobalTable, so switching would replace the retained
+    tables. On-demand capacity already absorbs BeginJobRun bursts at this
+    scale; warm throughput can be set on Table if that ever changes.
   - S3 versioning not relied upon for application semantics (per s3-layout.md),
     but enabled on private bucket as an operational safety net.
   - Public site bucket has static website hosting disabled at infra level;
     content is served via CloudFront (future) or direct S3 URLs for MVP.
   - Both buckets block all public access by default. Public site access
     will be granted via bucket policy to a CloudFront OAC (future epic).
-  - SNS quarantine topic: one shared topic; workflow name + reason in message body
-    allows subscribers to filter. Per-workflow topics deferred as unnecessary
+  - SNS quarantine topic: one shared topic; workflow name + reason are published
+    as message attributes, so subscribers filter at the topic via
+    quarantine_filter_policy. Per-workflow topics deferred as unnecessary
     complexity at current scale.
 """
 
@@ -86,7 +91,9 @@ class NovaCatStorage(Construct):
                 type=dynamodb.AttributeType.STRING,
             ),
             billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
-            point_in_time_recovery=enable_pitr,
+            point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(
+                point_in_time_recovery_enabled=enable_pitr,
+            ),
             removal_policy=removal_policy,
             time_to_live_attribute="ttl",
         )
@@ -139,7 +146,9 @@ class NovaCatStorage(Construct):
                 type=dynamodb.AttributeType.STRING,
             ),
             billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
-            point_in_time_recovery=enable_pitr,
+            point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(
+                point_in_time_recovery_enabled=enable_pitr,
+            ),
             removal_policy=removal_policy,
             time_to_live_attribute="ttl",
         )
@@ -159,6 +168,16 @@ class NovaCatStorage(Construct):
         # Lifecycle rules:
         #   - quarantine/ prefix: expire after 365 days (human review window)
         #   - workflow-payloads/ prefix: expire after 30 days (transient debugging)
+        #   - raw/ prefix: noncurrent versions expire after 30 days. Raw bytes
+        #     are append-only, so a noncurrent version only exists after a
+        #     re-acquisition overwrite; 30 days is the recovery window.
+        #   - derived/ prefix: noncurrent versions expire after 7 days. Derived
+        #     artifacts are rewritten on every regeneration and can always be
+        #     rebuilt, so old versions would otherwise accumulate unbounded.
+        #
+        # Object Lock is deliberately not used for raw/: it can only be
+        # enabled on a new bucket, and the lifecycle rules above already
+        # bound the versioning overhead to the recovery window.
         # ------------------------------------------------------------------
         self.private_bucket = s3.Bucket(
             self,
@@ -182,6 +201,16 @@ class NovaCatStorage(Construct):
                     prefix="workflow-payloads/",
                     expiration=cdk.Duration.days(30),
                 ),
+                s3.LifecycleRule(
+                    id="ExpireNoncurrentRawVersions",
+                    prefix="raw/",
+                    noncurrent_version_expiration=cdk.Duration.days(30),
+                ),
+                s3.LifecycleRule(
+                    id="ExpireNoncurrentDerivedVersions",
+                    prefix="derived/",
+                    noncurrent_version_expiration=cdk.Duration.days(7),
+                ),
             ],
         )
 
@@ -225,6 +254,8 @@ class NovaCatStorage(Construct):
         # Message structure (enforced by Lambda convention, not SNS):
         #   workflow_name, nova_id / data_product_id, correlation_id,
         #   error_fingerprint, quarantine_reason_code
+        # Message attributes (for subscription filter policies):
+        #   workflow_name, quarantine_reason_code
         # ------------------------------------------------------------------
         self.quarantine_topic = sns.Topic(
             self,
@@ -271,3 +302,41 @@ class NovaCatStorage(Construct):
             description="NovaCat dedicated photometry DynamoDB table name",
             export_name=f"{cf_prefix}-PhotometryTableName",
         )
+
+    @staticmethod
+    def quarantine_filter_policy(
+        *,
+        workflow_names: list[str] | None = None,
+        reason_codes: list[str] | None = None,
+    ) -> dict[str, sns.SubscriptionFilter] | None:
+        """
+        Build an SNS filter policy over the quarantine message attributes.
+
+        Filters match the message attributes published by quarantine_handler,
+        so a subscriber only interested in e.g. one workflow or one reason
+        code is never invoked for the rest. Omitted filters match everything;
+        returns None when neither is given.
+
+        Pass the result to a subscription target rather than a raw
+        sns.Subscription, so the invoke permission or queue policy is
+        created too::
+
+            storage.quarantine_topic.add_subscription(
+                subs.LambdaSubscription(
+                    fn,
+                    filter_policy=NovaCatStorage.quarantine_filter_policy(
+                        workflow_names=["initialize_nova"]
+                    ),
+                )
+            )
+        """
+        filter_policy: dict[str, sns.SubscriptionFilter] = {}
+        if workflow_names:
+            filter_policy["workflow_name"] = sns.SubscriptionFilter.string_filter(
+                allowlist=workflow_names
+            )
+        if reason_codes:
+            filter_policy["quarantine_reason_code"] = sns.SubscriptionFilter.string_filter(
+                allowlist=reason_codes
+            )
+        return filter_policy or None
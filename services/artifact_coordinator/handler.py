@@ -201,7 +201,7 @@ def _find_latest_active_plan() -> dict[str, Any] | None:
 
 def _abandon_plan(plan_item: dict[str, Any]) -> None:
     """Set a PENDING plan's status to ABANDONED (§4.2 step 2)."""
-    now = datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    now = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
     _table.update_item(
         Key={"PK": _REGEN_PLAN_PK, "SK": plan_item["SK"]},
         UpdateExpression="SET #s = :abandoned, completed_at = :now",
@@ -292,7 +292,7 @@ def _persist_batch_plan(
 ) -> tuple[str, str]:
     """Write a RegenBatchPlan item and return ``(plan_id, SK)``."""
     now = datetime.now(UTC)
-    created_at = now.isoformat(timespec="seconds").replace("+00:00", "Z")
+    created_at = now.strftime("%Y-%m-%dT%H:%M:%SZ")
     plan_id = str(uuid4())
     sk = f"{created_at}#{plan_id}"
     ttl = int(now.timestamp()) + (_PLAN_TTL_DAYS * _SECONDS_PER_DAY)
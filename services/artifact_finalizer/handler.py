@@ -51,7 +51,6 @@ from contracts.models.regeneration import PlanStatus
 _TABLE_NAME = os.environ["NOVA_CAT_TABLE_NAME"]
 _WORKQUEUE_PK = "WORKQUEUE"
 _REGEN_PLAN_PK = "REGEN_PLAN"
-_BATCH_DELETE_LIMIT = 25  # DDB batch_write_item max per call
 
 # ---------------------------------------------------------------------------
 # AWS clients
@@ -185,7 +184,7 @@ def _update_plan_in_progress(event: dict[str, Any], context: object) -> dict[str
     logger.info("Updating plan to IN_PROGRESS", extra={"execution_arn": execution_arn})
 
     plan = _load_batch_plan(plan_id)
-    now = datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    now = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
     _table.update_item(
         Key={"PK": _REGEN_PLAN_PK, "SK": plan["SK"]},
         UpdateExpression="SET #s = :status, execution_arn = :arn, updated_at = :now",
@@ -240,28 +239,19 @@ def _delete_work_items_for_nova(
 ) -> None:
     """Delete consumed WorkItems for a succeeded nova (§4.5).
 
-    Uses ``batch_write_item`` with batches of 25 (DDB limit).
-    Only deletes items from the ``workitem_sks`` snapshot — not any
-    WorkItems that arrived during execution.
+    Uses the table's ``batch_writer``, which buffers deletes into
+    ``BatchWriteItem`` calls of up to 25 (DDB limit) and resubmits any
+    ``UnprocessedItems`` returned under throttling. Only deletes items
+    from the ``workitem_sks`` snapshot — not any WorkItems that arrived
+    during execution.
     """
     sks_to_delete = _filter_sks_for_nova(nova_id, workitem_sks)
     if not sks_to_delete:
         return
 
-    for i in range(0, len(sks_to_delete), _BATCH_DELETE_LIMIT):
-        batch = sks_to_delete[i : i + _BATCH_DELETE_LIMIT]
-        _dynamodb.batch_write_item(
-            RequestItems={
-                _TABLE_NAME: [
-                    {
-                        "DeleteRequest": {
-                            "Key": {"PK": _WORKQUEUE_PK, "SK": sk},
-                        }
-                    }
-                    for sk in batch
-                ]
-            }
-        )
+    with _table.batch_writer() as batch:
+        for sk in sks_to_delete:
+            batch.delete_item(Key={"PK": _WORKQUEUE_PK, "SK": sk})
 
 
 def _count_work_items_for_novae(
@@ -315,7 +305,7 @@ def _write_observation_counts(
 
 def _update_plan_status(plan_sk: str, status: PlanStatus) -> None:
     """Update the RegenBatchPlan status and completed_at timestamp."""
-    now = datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    now = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
     _table.update_item(
         Key={"PK": _REGEN_PLAN_PK, "SK": plan_sk},
         UpdateExpression="SET #s = :status, completed_at = :now",
@@ -105,7 +105,7 @@ def _compute_band_set_hash(band_labels: list[str]) -> str:
 
 def _now_iso() -> str:
     """Return the current UTC time as an ISO 8601 string."""
-    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def _decimal_map_to_float(m: dict[str, Any]) -> dict[str, float]:
@@ -19,9 +19,15 @@ import traceback
 from datetime import UTC, datetime
 from typing import Any
 
+import orjson
+
 # Fields that ``clear_nova_context()`` removes between per-nova iterations.
 _NOVA_CONTEXT_KEYS = frozenset({"nova_id", "artifact", "phase", "primary_name"})
 
+# orjson options: numpy scalars serialize natively (generators log them in
+# extra fields) and non-str keys are coerced rather than raising.
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
 
 class LogContext:
     """Persistent key-value store merged into every log record.
@@ -83,7 +89,12 @@ class StructuredJsonFormatter(logging.Formatter):
         if record.exc_info and record.exc_info[0] is not None:
             entry["exception"] = "".join(traceback.format_exception(*record.exc_info))
 
-        return json.dumps(entry, default=str)
+        try:
+            return orjson.dumps(entry, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            # orjson rejects some values default= never sees (lone surrogates,
+            # ints wider than 64 bits); stdlib json handles both.
+            return json.dumps(entry, default=str)
 
 
 # Fields that are part of the stdlib LogRecord — we skip these when
@@ -51,8 +51,9 @@ Manual override:
 from __future__ import annotations
 
 import os
+import time
 from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from typing import Any
 
 import boto3
@@ -66,6 +67,7 @@ from nova_common.tracing import tracer
 _TABLE_NAME = os.environ["NOVA_CAT_TABLE_NAME"]
 _SCHEMA_VERSION = "1"
 _LOCK_TTL_MINUTES = 15
+_LOCK_TTL_SECONDS = _LOCK_TTL_MINUTES * 60
 _TIME_BUCKET_FORMAT = "%Y-%m-%dT%H"  # 1-hour granularity
 
 _dynamodb = boto3.resource("dynamodb")
@@ -181,13 +183,12 @@ def _compute_key(workflow_name: str, primary_id: str) -> str:
 
 
 def _now() -> str:
-    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def _ttl_epoch() -> int:
     """TTL for the lock item — 15 minutes from now, as Unix epoch seconds."""
-    expiry = datetime.now(UTC) + timedelta(minutes=_LOCK_TTL_MINUTES)
-    return int(expiry.timestamp())
+    return time.time_ns() // 1_000_000_000 + _LOCK_TTL_SECONDS
 
 
 # ---------------------------------------------------------------------------
@@ -45,6 +45,8 @@ from nova_common.tracing import tracer
 
 _TABLE_NAME = os.environ["NOVA_CAT_TABLE_NAME"]
 _SCHEMA_VERSION = "1"
+# Stored error_message length cap; Step Functions Cause can be up to 32 KB.
+_ERROR_CAUSE_MAX_CHARS = 500
 
 _dynamodb = boto3.resource("dynamodb")
 _table = _dynamodb.Table(_TABLE_NAME)
@@ -182,7 +184,7 @@ def _finalize_job_run_success(event: dict[str, Any], context: object) -> dict[st
 def _finalize_job_run_failed(event: dict[str, Any], context: object) -> dict[str, Any]:
     """Emit JobRun FAILED with error classification."""
     job_run: dict[str, Any] = event["job_run"]
-    error: dict[str, Any] = event.get("error", {})
+    error: dict[str, Any] = event.get("error") or {}
     ended_at: str = _now()
 
     _table.update_item(
@@ -196,7 +198,7 @@ def _finalize_job_run_failed(event: dict[str, Any], context: object) -> dict[str
         ExpressionAttributeValues={
             ":status": "FAILED",
             ":error_type": error.get("Error", "UnknownError"),
-            ":error_message": error.get("Cause", "")[:500],
+            ":error_message": _error_cause(error),
             ":ended_at": ended_at,
             ":updated_at": ended_at,
         },
@@ -261,7 +263,7 @@ def _terminal_fail_handler(event: dict[str, Any], context: object) -> dict[str,
     error: dict[str, Any] = event.get("error") or {}
 
     error_type: str = error.get("Error") or "UnknownError"
-    error_cause: str = (error.get("Cause") or "")[:500]
+    error_cause = _error_cause(error)
 
     error_classification = "RETRYABLE" if "RetryableError" in error_type else "TERMINAL"
 
@@ -303,7 +305,12 @@ def _terminal_fail_handler(event: dict[str, Any], context: object) -> dict[str,
 
 
 def _now() -> str:
-    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _error_cause(error: dict[str, Any]) -> str:
+    """Return the Step Functions error Cause (may be absent or null), truncated for persistence."""
+    return (error.get("Cause") or "")[:_ERROR_CAUSE_MAX_CHARS]
 
 
 # ---------------------------------------------------------------------------
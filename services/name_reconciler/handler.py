@@ -20,12 +20,9 @@ Environment variables (injected by CDK):
 
 from __future__ import annotations
 
-import logging
-import os
 from collections.abc import Callable
 
-logger = logging.getLogger(__name__)
-logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+from nova_common.logging import configure_logging, logger
 
 
 def handle(event: dict, context: object) -> dict:
@@ -40,6 +37,7 @@ def handle(event: dict, context: object) -> dict:
             ... task-specific fields ...
         }
     """
+    configure_logging(event)
     task_name = event.get("task_name")
     if not task_name:
         raise ValueError("Missing required field: task_name")
@@ -48,14 +46,7 @@ def handle(event: dict, context: object) -> dict:
     if handler_fn is None:
         raise ValueError(f"Unknown task_name: {task_name!r}. Known tasks: {list(_TASK_HANDLERS)}")
 
-    logger.info(
-        "Dispatching task",
-        extra={
-            "task_name": task_name,
-            "correlation_id": event.get("correlation_id"),
-            "nova_id": event.get("nova_id"),
-        },
-    )
+    logger.info("Dispatching task", extra={"task_name": task_name})
 
     return handler_fn(event, context)
 
@@ -70,7 +70,7 @@ _logger = logging.getLogger(__name__)
 
 def _now_iso() -> str:
     """Return the current UTC time as an ISO 8601 string with 'Z' suffix."""
-    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def _ttl_epoch(created_at: datetime) -> int:
@@ -117,7 +117,7 @@ def write_work_item(
         Cross-workflow tracing identifier.
     """
     now = datetime.now(UTC)
-    created_at = now.isoformat(timespec="seconds").replace("+00:00", "Z")
+    created_at = now.strftime("%Y-%m-%dT%H:%M:%SZ")
     sk = f"{nova_id}#{dirty_type.value}#{created_at}"
 
     try:
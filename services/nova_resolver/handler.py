@@ -24,7 +24,6 @@ from __future__ import annotations
 
 import math
 import os
-import re
 import uuid
 from collections.abc import Callable
 from datetime import UTC, datetime
@@ -91,7 +90,7 @@ def _normalize_candidate_name(event: dict[str, Any], context: object) -> dict[st
     if not candidate_name or not candidate_name.strip():
         raise TerminalError(f"candidate_name is empty or whitespace-only: {candidate_name!r}")
 
-    normalized = re.sub(r"\s+", " ", candidate_name.replace("_", " ").strip().lower())
+    normalized = " ".join(candidate_name.replace("_", " ").lower().split())
 
     logger.info(
         "Candidate name normalized",
@@ -117,6 +116,7 @@ def _check_existing_nova_by_name(event: dict[str, Any], context: object) -> dict
 
     response = _table.query(
         KeyConditionExpression=Key("PK").eq(pk),
+        ProjectionExpression="nova_id",
         Limit=1,
     )
 
@@ -269,6 +269,8 @@ def _upsert_minimal_nova_metadata(event: dict[str, Any], context: object) -> dic
       2. Writes a PRIMARY NameMapping item
       3. Writes an ALIAS NameMapping item for each SIMBAD alias, if provided
 
+    NameMapping items (2 and 3) are written in one batch.
+
     The `aliases` field on the Nova item is a denormalized list of raw alias
     strings (e.g. ["NOVA Sco 2012", "Gaia DR3 4043499439062100096"]).
     It exists so that refresh_references can retrieve all known names for a
@@ -302,7 +304,7 @@ def _upsert_minimal_nova_metadata(event: dict[str, Any], context: object) -> dic
     demote_candidate: bool = False
 
     if simbad_main_id:
-        simbad_normalized = re.sub(r"\s+", " ", simbad_main_id.strip().lower())
+        simbad_normalized = " ".join(simbad_main_id.lower().split())
         if simbad_normalized != normalized_candidate_name:
             effective_name = simbad_main_id
             effective_normalized = simbad_normalized
@@ -336,68 +338,73 @@ def _upsert_minimal_nova_metadata(event: dict[str, Any], context: object) -> dic
         },
     )
 
-    # Write PRIMARY NameMapping
-    _check_name_collision(effective_normalized, nova_id)
-    _table.put_item(
-        Item={
-            "PK": f"NAME#{effective_normalized}",
-            "SK": f"NOVA#{nova_id}",
-            "entity_type": "NameMapping",
-            "schema_version": _SCHEMA_VERSION,
-            "name_raw": effective_name,
-            "name_normalized": effective_normalized,
-            "name_kind": "PRIMARY",
-            "nova_id": nova_id,
-            "source": primary_source,
-            "created_at": now,
-            "updated_at": now,
-        }
-    )
-
-    # Demote original candidate_name to ALIAS if SIMBAD name took over
-    if demote_candidate:
-        _check_name_collision(normalized_candidate_name, nova_id)
-        _table.put_item(
+    # NameMapping items are buffered into BatchWriteItem calls rather than
+    # written one round-trip at a time. overwrite_by_pkeys de-duplicates
+    # aliases that normalize to the same key (last write wins, as before).
+    nova_sk = f"NOVA#{nova_id}"
+    with _table.batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
+        # Write PRIMARY NameMapping
+        _check_name_collision(effective_normalized, nova_id)
+        batch.put_item(
             Item={
-                "PK": f"NAME#{normalized_candidate_name}",
-                "SK": f"NOVA#{nova_id}",
+                "PK": f"NAME#{effective_normalized}",
+                "SK": nova_sk,
                 "entity_type": "NameMapping",
                 "schema_version": _SCHEMA_VERSION,
-                "name_raw": candidate_name,
-                "name_normalized": normalized_candidate_name,
-                "name_kind": "ALIAS",
+                "name_raw": effective_name,
+                "name_normalized": effective_normalized,
+                "name_kind": "PRIMARY",
                 "nova_id": nova_id,
-                "source": "INGESTION",
+                "source": primary_source,
                 "created_at": now,
                 "updated_at": now,
             }
         )
 
-    # Write ALIAS NameMapping items for each SIMBAD alias
-    alias_count = 0
-    for alias_raw in aliases:
-        normalized_alias = re.sub(r"\s+", " ", alias_raw.replace("_", " ").strip().lower())
-        if not normalized_alias:
-            continue
-        if normalized_alias in (normalized_candidate_name, effective_normalized):
-            continue
-        _check_name_collision(normalized_alias, nova_id)
-        _table.put_item(
-            Item={
-                "PK": f"NAME#{normalized_alias}",
-                "SK": f"NOVA#{nova_id}",
-                "entity_type": "NameMapping",
-                "schema_version": _SCHEMA_VERSION,
-                "name_raw": alias_raw,
-                "name_normalized": normalized_alias,
-                "name_kind": "ALIAS",
-                "nova_id": nova_id,
-                "source": "SIMBAD",
-                "created_at": now,
-                "updated_at": now,
-            }
-        )
-        alias_count += 1
+        # Demote original candidate_name to ALIAS if SIMBAD name took over
+        if demote_candidate:
+            _check_name_collision(normalized_candidate_name, nova_id)
+            batch.put_item(
+                Item={
+                    "PK": f"NAME#{normalized_candidate_name}",
+                    "SK": nova_sk,
+                    "entity_type": "NameMapping",
+                    "schema_version": _SCHEMA_VERSION,
+                    "name_raw": candidate_name,
+                    "name_normalized": normalized_candidate_name,
+                    "name_kind": "ALIAS",
+                    "nova_id": nova_id,
+                    "source": "INGESTION",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+
+        # Write ALIAS NameMapping items for each SIMBAD alias
+        alias_count = 0
+        for alias_raw in aliases:
+            normalized_alias = " ".join(alias_raw.replace("_", " ").lower().split())
+            if not normalized_alias:
+                continue
+            if normalized_alias in (normalized_candidate_name, effective_normalized):
+                continue
+            _check_name_collision(normalized_alias, nova_id)
+            batch.put_item(
+                Item={
+                    "PK": f"NAME#{normalized_alias}",
+                    "SK": nova_sk,
+                    "entity_type": "NameMapping",
+                    "schema_version": _SCHEMA_VERSION,
+                    "name_raw": alias_raw,
+                    "name_normalized": normalized_alias,
+                    "name_kind": "ALIAS",
+                    "nova_id": nova_id,
+                    "source": "SIMBAD",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+            alias_count += 1
 
     logger.info(
         "Minimal nova metadata upserted",
@@ -505,7 +512,7 @@ def _angular_separation_arcsec(
 
 
 def _now() -> str:
-    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 # ---------------------------------------------------------------------------
@@ -51,7 +51,6 @@ must fall back to archive-resolution for unknown candidates.  Only an
 from __future__ import annotations
 
 import json
-import re
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
@@ -86,7 +85,7 @@ def _normalize_name(name: str) -> str:
     strip → replace underscores with spaces → lowercase → collapse
     whitespace.
     """
-    return re.sub(r"\s+", " ", name.replace("_", " ").strip().lower())
+    return " ".join(name.replace("_", " ").lower().split())
 
 
 # ---------------------------------------------------------------------------
@@ -41,7 +41,6 @@ from __future__ import annotations
 
 import json
 import os
-import re
 from typing import Any, cast
 
 import boto3
@@ -165,7 +164,7 @@ def _resolve_nova(event: dict[str, Any]) -> dict[str, Any]:
 
 def _normalize(name: str) -> str:
     """Strip, lowercase, replace underscores with spaces, and collapse internal whitespace — identical to nova_resolver."""
-    return re.sub(r"\s+", " ", name.replace("_", " ").strip().lower())
+    return " ".join(name.replace("_", " ").lower().split())
 
 
 def _extract_nova_id(output: dict[str, Any], execution_arn: str) -> str:
@@ -252,7 +251,10 @@ def _fetch_coordinates(nova_id: str) -> tuple[float | None, float | None]:
                        never happen immediately after a successful resolution,
                        and indicates an infrastructure invariant violation.
     """
-    resp = _table.get_item(Key={"PK": nova_id, "SK": "NOVA"})
+    resp = _table.get_item(
+        Key={"PK": nova_id, "SK": "NOVA"},
+        ProjectionExpression="PK, ra_deg, dec_deg",
+    )
     item: dict[str, Any] | None = resp.get("Item")
     if item is None:
         raise TerminalError(
@@ -102,6 +102,19 @@ _CLASSIFICATION_REASON_FALLBACK = "Quarantine triggered — see error_fingerprin
 # and should be captured into extra_context on the JobRun.
 _EXTRA_CONTEXT_FIELDS = frozenset({"min_sep_arcsec"})
 
+# JobRun quarantine update. The extra_context clause is appended only when
+# the event carries extra diagnostic fields.
+_QUARANTINE_UPDATE_EXPRESSION = (
+    "SET quarantine_reason_code = :reason_code, "
+    "classification_reason = :classification_reason, "
+    "error_fingerprint = :error_fingerprint, "
+    "quarantined_at = :quarantined_at, "
+    "updated_at = :updated_at"
+)
+_QUARANTINE_UPDATE_EXPRESSION_WITH_CONTEXT = (
+    _QUARANTINE_UPDATE_EXPRESSION + ", extra_context = :extra_context"
+)
+
 
 # ---------------------------------------------------------------------------
 # Public entry point
@@ -174,13 +187,7 @@ def _quarantine_handler(event: dict[str, Any], context: object) -> dict[str, Any
     # ------------------------------------------------------------------
     # Persist quarantine diagnostics onto the existing JobRun record
     # ------------------------------------------------------------------
-    update_expr_parts = [
-        "quarantine_reason_code = :reason_code",
-        "classification_reason = :classification_reason",
-        "error_fingerprint = :error_fingerprint",
-        "quarantined_at = :quarantined_at",
-        "updated_at = :updated_at",
-    ]
+    update_expression = _QUARANTINE_UPDATE_EXPRESSION
     expr_values: dict[str, Any] = {
         ":reason_code": quarantine_reason_code,
         ":classification_reason": classification_reason,
@@ -190,12 +197,12 @@ def _quarantine_handler(event: dict[str, Any], context: object) -> dict[str, Any
     }
 
     if extra_context:
-        update_expr_parts.append("extra_context = :extra_context")
+        update_expression = _QUARANTINE_UPDATE_EXPRESSION_WITH_CONTEXT
         expr_values[":extra_context"] = extra_context
 
     _table.update_item(
         Key={"PK": job_run["pk"], "SK": job_run["sk"]},
-        UpdateExpression="SET " + ", ".join(update_expr_parts),
+        UpdateExpression=update_expression,
         ExpressionAttributeValues=expr_values,
     )
 
@@ -262,6 +269,10 @@ def _publish_quarantine_notification(
     """
     Publish a quarantine notification to SNS.
 
+    workflow_name and quarantine_reason_code are also sent as message
+    attributes so subscribers can filter at the topic (see
+    NovaCatStorage.quarantine_filter_policy) instead of in-process.
+
     Errors are caught and logged — SNS failure must not propagate to the
     caller or cause the workflow to fail.
     """
@@ -278,6 +289,13 @@ def _publish_quarantine_notification(
             TopicArn=_QUARANTINE_TOPIC_ARN,
             Subject=f"[NovaCat] Quarantine: {workflow_name} — {quarantine_reason_code}",
             Message=json.dumps(payload, indent=2),
+            MessageAttributes={
+                "workflow_name": {"DataType": "String", "StringValue": workflow_name},
+                "quarantine_reason_code": {
+                    "DataType": "String",
+                    "StringValue": quarantine_reason_code,
+                },
+            },
         )
         logger.info(
             "Quarantine SNS notification published",
@@ -291,7 +309,7 @@ def _publish_quarantine_notification(
 
 
 def _now() -> str:
-    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 # ---------------------------------------------------------------------------
@@ -221,7 +221,10 @@ def _handle_fetchReferenceCandidates(event: dict, context: object) -> dict:
 
     ads_name_hints: list[str] = (event.get("attributes") or {}).get("ads_name_hints") or []
 
-    nova_item = _table.get_item(Key={"PK": nova_id, "SK": "NOVA"}).get("Item")
+    nova_item = _table.get_item(
+        Key={"PK": nova_id, "SK": "NOVA"},
+        ProjectionExpression="PK, primary_name, aliases",
+    ).get("Item")
     if not nova_item:
         raise TerminalError(f"Nova not found in DDB: {nova_id}")
 
@@ -545,7 +548,10 @@ def _handle_upsertDiscoveryDateMetadata(event: dict, context: object) -> dict:
         )
         return {"nova_id": nova_id, "updated": False, "discovery_date": None}
 
-    nova_item = _table.get_item(Key={"PK": nova_id, "SK": "NOVA"}).get("Item")
+    nova_item = _table.get_item(
+        Key={"PK": nova_id, "SK": "NOVA"},
+        ProjectionExpression="PK, discovery_date",
+    ).get("Item")
     if not nova_item:
         raise TerminalError(f"Nova not found: {nova_id}")
 
@@ -54,6 +54,11 @@ _s3 = boto3.client("s3")
 _DOWNLOAD_TIMEOUT_S = 60 * 14  # 14 min — safely within Lambda 15-min hard limit
 _CHUNK_SIZE = 256 * 1024  # 256 KB streaming chunks
 
+# S3 put_object error codes that are transient and safe to retry.
+_S3_TRANSIENT_ERROR_CODES = frozenset(
+    {"ServiceUnavailable", "InternalError", "RequestTimeout", "SlowDown"}
+)
+
 # Backoff schedule: index is (attempt_count - 1), capped at last entry.
 _BACKOFF_SCHEDULE_S = [60, 300, 3_600, 86_400]
 
@@ -297,7 +302,7 @@ def _stream_to_s3(
             )
     except ClientError as exc:
         code = exc.response["Error"]["Code"]
-        if code in {"ServiceUnavailable", "InternalError", "RequestTimeout", "SlowDown"}:
+        if code in _S3_TRANSIENT_ERROR_CODES:
             raise _RetryableDownloadError(
                 f"S3 put_object transient failure ({code}): {exc}"
             ) from exc
@@ -437,7 +442,7 @@ def _add_seconds(iso_utc: str, seconds: int) -> str:
 
 
 def _now() -> str:
-    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 # ---------------------------------------------------------------------------
@@ -131,7 +131,10 @@ def _handle_query_provider_for_products(event: dict[str, Any], context: object)
     adapter = _resolve_adapter(provider)
 
     try:
-        response = _table.get_item(Key={"PK": nova_id, "SK": "NOVA"})
+        response = _table.get_item(
+            Key={"PK": nova_id, "SK": "NOVA"},
+            ProjectionExpression="PK, ra_deg, dec_deg, primary_name, aliases",
+        )
     except ClientError as exc:
         raise RetryableError(f"DynamoDB get_item failed fetching Nova {nova_id!r}: {exc}") from exc
 
@@ -707,7 +710,7 @@ def _sanitize_hints_for_dynamodb(hints: dict[str, Any]) -> dict[str, Any]:
 
 
 def _now() -> str:
-    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 # ---------------------------------------------------------------------------
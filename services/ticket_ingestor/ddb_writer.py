@@ -15,6 +15,7 @@ moto-patched objects directly without any import-time side effects.
 
 from __future__ import annotations
 
+import enum
 import hashlib
 import json
 import uuid
@@ -95,8 +96,12 @@ def write_photometry_rows(
     rows_written = 0
     rows_skipped_duplicate = 0
 
+    # Fields shared by every row in this write are built once and copied
+    # per row; all rows from one ingestion share a single ingested_at.
+    item_template = _photometry_item_template(nova_id)
+
     for resolved in rows:
-        item = _photometry_row_to_item(nova_id=nova_id, resolved_row=resolved)
+        item = _photometry_row_to_item(item_template, resolved_row=resolved)
         try:
             table.put_item(
                 Item=item,
@@ -266,15 +271,29 @@ def upsert_envelope_item(
 
 def _now_iso() -> str:
     """Return the current UTC time as an ISO 8601 string with 'Z' suffix."""
-    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _photometry_item_template(nova_id: uuid.UUID) -> dict[str, Any]:
+    """Return the fields common to every PhotometryRow item for *nova_id*."""
+    return {
+        "PK": str(nova_id),
+        "entity_type": _ENTITY_TYPE_ROW,
+        "schema_version": _PHOTOMETRY_SCHEMA_VERSION,
+        "ingested_at": _now_iso(),
+        "ingestion_source": _INGESTION_SOURCE,
+    }
 
 
 def _photometry_row_to_item(
-    nova_id: uuid.UUID,
+    item_template: dict[str, Any],
     resolved_row: ResolvedRow,
 ) -> dict[str, Any]:
     """Serialise a ResolvedRow into a DynamoDB item dict.
 
+    *item_template* (from ``_photometry_item_template``) supplies the
+    per-write constant fields and is copied, never mutated.
+
     Conversion rules applied to each PhotometryRow field:
       - ``float``  → ``Decimal(str(v))``   (DDB rejects Python floats)
       - ``UUID``   → ``str(v)``
@@ -291,14 +310,8 @@ def _photometry_row_to_item(
     # our own coercions uniformly.
     raw: dict[str, Any] = row.model_dump(mode="python", exclude_none=True)
 
-    item: dict[str, Any] = {
-        "PK": str(nova_id),
-        "SK": f"PHOT#{resolved_row.row_id}",
-        "entity_type": _ENTITY_TYPE_ROW,
-        "schema_version": _PHOTOMETRY_SCHEMA_VERSION,
-        "ingested_at": _now_iso(),
-        "ingestion_source": _INGESTION_SOURCE,
-    }
+    item = item_template.copy()
+    item["SK"] = f"PHOT#{resolved_row.row_id}"
 
     for field_name, value in raw.items():
         item[field_name] = _coerce_for_ddb(value)
@@ -315,8 +328,6 @@ def _coerce_for_ddb(value: Any) -> Any:
 
     Nested structures (lists, dicts) are coerced recursively.
     """
-    import enum  # local import to keep module-level imports minimal
-
     if isinstance(value, float):
         return Decimal(str(value))
     if isinstance(value, uuid.UUID):
@@ -58,7 +58,7 @@ _CONTENT_TYPE = "application/fits"
 
 def _now_iso() -> str:
     """Return the current UTC time as an ISO 8601 string with 'Z' suffix."""
-    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def _coerce_for_ddb(value: Any) -> Any:
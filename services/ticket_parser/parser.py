@@ -398,8 +398,10 @@ def validate_ticket(
         return model_cls.model_validate(mapped)
     except ValidationError as exc:
         # Produce a compact, operator-readable summary of every failing field.
+        # Only loc and msg are used, so skip building url/context/input.
+        errors = exc.errors(include_url=False, include_context=False, include_input=False)
         problems = "; ".join(
-            f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}" for e in exc.errors()
+            f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}" for e in errors
         )
         raise TicketParseError(
             path=path,
@@ -75,6 +75,11 @@ _ACQUIRE_AND_VALIDATE_SPECTRA_STATE_MACHINE_ARN = os.environ[
 _FANOUT_BATCH_SIZE = 5  # executions per batch
 _FANOUT_BATCH_DELAY_S = 8.0  # seconds between batches
 
+# StartExecution error codes that are transient and safe to retry.
+_SFN_TRANSIENT_ERROR_CODES = frozenset(
+    {"ThrottlingException", "ServiceUnavailable", "InternalServerError"}
+)
+
 _sfn = boto3.client("stepfunctions")
 _dynamodb = boto3.resource("dynamodb")
 _table = _dynamodb.Table(os.environ["NOVA_CAT_TABLE_NAME"])
@@ -432,7 +437,7 @@ def _start_execution(
                 "execution_name": execution_name,
                 "already_existed": True,
             }
-        if code in {"ThrottlingException", "ServiceUnavailable", "InternalServerError"}:
+        if code in _SFN_TRANSIENT_ERROR_CODES:
             raise RetryableError(
                 f"SFN StartExecution transient failure ({code}) for "
                 f"{workflow_label} nova_id={nova_id}"
@@ -459,7 +464,7 @@ def _start_execution(
 
 
 def _now() -> str:
-    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,37 @@
+"""Shared fixtures for the CDK synth tests.
+
+CDK synthesis takes several seconds, so the stack is synthesized once per
+test session and the resulting template is shared by every infra test.
+"""
+
+from __future__ import annotations
+
+import aws_cdk as cdk
+import pytest
+from aws_cdk import assertions
+from nova_cat.nova_cat_stack import NovaCatStack
+
+_ACCOUNT = "000000000000"
+_REGION = "us-east-1"
+
+
+@pytest.fixture(scope="session")
+def template() -> assertions.Template:
+    """Synthesize the stack once for all infra tests."""
+    app = cdk.App(
+        context={
+            "account": _ACCOUNT,
+            # Disable Docker bundling during synth. Without this, CDK tries to
+            # build Docker images for DockerImageFunction constructs, which
+            # fails in CI and act where no Docker daemon is available. Setting
+            # this to an empty list tells CDK to skip bundling for all stacks —
+            # the resulting template is identical; assets just aren't staged.
+            "aws:cdk:bundling-stacks": [],
+        }
+    )
+    stack = NovaCatStack(
+        app,
+        "NovaCatTest",
+        env=cdk.Environment(account=_ACCOUNT, region=_REGION),
+    )
+    return assertions.Template.from_stack(stack)
@@ -1,8 +1,9 @@
 """
 Nova Cat CDK synth tests.
 
-Uses aws_cdk.assertions to synthesize the stack once and assert that the
-resulting CloudFormation template matches the expected architecture.
+Uses aws_cdk.assertions to assert that the synthesized CloudFormation
+template matches the expected architecture. The stack is synthesized once
+per session by the ``template`` fixture in conftest.py.
 
 These tests pin architectural decisions — billing mode, GSI shape, bucket
 policies, Lambda configuration — so that future changes can't silently
@@ -15,35 +16,12 @@ Run with:
 from __future__ import annotations
 
 import aws_cdk as cdk
+import aws_cdk.aws_sns as sns
+import aws_cdk.aws_sns_subscriptions as subs
+import aws_cdk.aws_sqs as sqs
 import pytest
 from aws_cdk import assertions
-from nova_cat.nova_cat_stack import NovaCatStack
-
-_ACCOUNT = "000000000000"
-_REGION = "us-east-1"
-
-
-@pytest.fixture(scope="module")
-def template() -> assertions.Template:
-    """Synthesize the stack once for all tests in this module."""
-    app = cdk.App(
-        context={
-            "account": _ACCOUNT,
-            # Disable Docker bundling during synth. Without this, CDK tries to
-            # build Docker images for DockerImageFunction constructs, which
-            # fails in CI and act where no Docker daemon is available. Setting
-            # this to an empty list tells CDK to skip bundling for all stacks —
-            # the resulting template is identical; assets just aren't staged.
-            "aws:cdk:bundling-stacks": [],
-        }
-    )
-    stack = NovaCatStack(
-        app,
-        "NovaCatTest",
-        env=cdk.Environment(account=_ACCOUNT, region=_REGION),
-    )
-    return assertions.Template.from_stack(stack)
-
+from nova_constructs.storage import NovaCatStorage
 
 # ---------------------------------------------------------------------------
 # DynamoDB
@@ -162,6 +140,40 @@ class TestS3:
             },
         )
 
+    def test_private_bucket_expires_noncurrent_versions(
+        self, template: assertions.Template
+    ) -> None:
+        template.has_resource_properties(
+            "AWS::S3::Bucket",
+            {
+                "VersioningConfiguration": {"Status": "Enabled"},
+                "LifecycleConfiguration": assertions.Match.object_like(
+                    {
+                        "Rules": assertions.Match.array_with(
+                            [
+                                assertions.Match.object_like(
+                                    {
+                                        "Id": "ExpireNoncurrentRawVersions",
+                                        "Prefix": "raw/",
+                                        "Status": "Enabled",
+                                        "NoncurrentVersionExpiration": {"NoncurrentDays": 30},
+                                    }
+                                ),
+                                assertions.Match.object_like(
+                                    {
+                                        "Id": "ExpireNoncurrentDerivedVersions",
+                                        "Prefix": "derived/",
+                                        "Status": "Enabled",
+                                        "NoncurrentVersionExpiration": {"NoncurrentDays": 7},
+                                    }
+                                ),
+                            ]
+                        ),
+                    }
+                ),
+            },
+        )
+
     def test_private_bucket_blocks_public_access(self, template: assertions.Template) -> None:
         template.has_resource_properties(
             "AWS::S3::Bucket",
@@ -247,6 +259,51 @@ class TestSns:
         )
 
 
+def _quarantine_subscription_template(
+    filter_policy: dict[str, sns.SubscriptionFilter] | None,
+) -> assertions.Template:
+    """Synthesize a throwaway stack with one SQS quarantine subscriber."""
+    stack = cdk.Stack(cdk.App(), "QuarantineSubscriptionTest")
+    storage = NovaCatStorage(stack, "Storage")
+    queue = sqs.Queue(stack, "Subscriber")
+    storage.quarantine_topic.add_subscription(
+        subs.SqsSubscription(queue, filter_policy=filter_policy)
+    )
+    return assertions.Template.from_stack(stack)
+
+
+class TestQuarantineSubscription:
+    def test_workflow_filter(self) -> None:
+        template = _quarantine_subscription_template(
+            NovaCatStorage.quarantine_filter_policy(workflow_names=["initialize_nova"])
+        )
+        template.has_resource_properties(
+            "AWS::SNS::Subscription",
+            {"Protocol": "sqs", "FilterPolicy": {"workflow_name": ["initialize_nova"]}},
+        )
+
+    def test_reason_filter(self) -> None:
+        template = _quarantine_subscription_template(
+            NovaCatStorage.quarantine_filter_policy(reason_codes=["COORDINATE_AMBIGUITY"])
+        )
+        template.has_resource_properties(
+            "AWS::SNS::Subscription",
+            {"FilterPolicy": {"quarantine_reason_code": ["COORDINATE_AMBIGUITY"]}},
+        )
+
+    def test_no_filter(self) -> None:
+        assert NovaCatStorage.quarantine_filter_policy() is None
+        template = _quarantine_subscription_template(None)
+        template.has_resource_properties(
+            "AWS::SNS::Subscription",
+            {"Protocol": "sqs", "FilterPolicy": assertions.Match.absent()},
+        )
+
+    def test_subscriber_queue_grants_topic_send(self) -> None:
+        template = _quarantine_subscription_template(None)
+        template.resource_count_is("AWS::SQS::QueuePolicy", 1)
+
+
 # ---------------------------------------------------------------------------
 # Lambda
 # ---------------------------------------------------------------------------
@@ -206,6 +206,48 @@ class TestFinalizeJobRunFailed:
             result = handler.handle(_finalize_event("FinalizeJobRunFailed", job_run), None)
             assert result["status"] == "FAILED"
 
+    def test_handles_null_cause(self, table: Any) -> None:
+        with mock_aws():
+            handler = _load_handler()
+            job_run = handler.handle(_base_event(), None)
+            handler.handle(
+                _finalize_event(
+                    "FinalizeJobRunFailed",
+                    job_run,
+                    error={"Error": "States.Timeout", "Cause": None},
+                ),
+                None,
+            )
+            item = table.get_item(Key={"PK": job_run["pk"], "SK": job_run["sk"]}).get("Item")
+            assert item["error_message"] == ""
+
+    def test_handles_null_error(self, table: Any) -> None:
+        with mock_aws():
+            handler = _load_handler()
+            job_run = handler.handle(_base_event(), None)
+            result = handler.handle(
+                _finalize_event("FinalizeJobRunFailed", job_run, error=None), None
+            )
+            assert result["status"] == "FAILED"
+            item = table.get_item(Key={"PK": job_run["pk"], "SK": job_run["sk"]}).get("Item")
+            assert item["error_type"] == "UnknownError"
+            assert item["error_message"] == ""
+
+    def test_truncates_long_cause(self, table: Any) -> None:
+        with mock_aws():
+            handler = _load_handler()
+            job_run = handler.handle(_base_event(), None)
+            handler.handle(
+                _finalize_event(
+                    "FinalizeJobRunFailed",
+                    job_run,
+                    error={"Error": "TerminalError", "Cause": "x" * 5000},
+                ),
+                None,
+            )
+            item = table.get_item(Key={"PK": job_run["pk"], "SK": job_run["sk"]}).get("Item")
+            assert item["error_message"] == "x" * 500
+
 
 # ---------------------------------------------------------------------------
 # FinalizeJobRunQuarantined
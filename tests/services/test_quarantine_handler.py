@@ -273,6 +273,20 @@ class TestQuarantineHandlerSns:
             assert "quarantine_reason_code" in payload
             assert "classification_reason" in payload
 
+    def test_sns_message_attributes_support_filter_policies(self, table: Any, topic: Any) -> None:
+        with mock_aws():
+            handler = _load_handler()
+            with patch.object(handler, "_sns") as mock_sns:
+                handler.handle(_base_event(), None)
+                _, kwargs = mock_sns.publish.call_args
+            assert kwargs["MessageAttributes"] == {
+                "workflow_name": {"DataType": "String", "StringValue": "initialize_nova"},
+                "quarantine_reason_code": {
+                    "DataType": "String",
+                    "StringValue": "COORDINATE_AMBIGUITY",
+                },
+            }
+
 
 # ---------------------------------------------------------------------------
 # Dispatch
@@ -845,6 +845,18 @@ class TestUpsertDiscoveryDateMetadata:
             nova = table.get_item(Key={"PK": _NOVA_ID, "SK": "NOVA"})["Item"]
             assert nova["discovery_date"] == "2013-06-00"
 
+    def test_finds_nova_without_optional_attributes(self, table: Any) -> None:
+        """The projected get_item still sees a Nova with no discovery_date or aliases."""
+        with mock_aws():
+            table.put_item(
+                Item={"PK": _NOVA_ID, "SK": "NOVA", "entity_type": "Nova", "nova_id": _NOVA_ID}
+            )
+            h = _load_handler()
+            result = h.handle(self._event(), None)
+            assert result["updated"] is True
+            nova = table.get_item(Key={"PK": _NOVA_ID, "SK": "NOVA"})["Item"]
+            assert nova["discovery_date"] == "2013-06-00"
+
     def test_returns_updated_true_when_written(self, table: Any) -> None:
         with mock_aws():
             _seed_nova(table)
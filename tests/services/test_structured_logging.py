@@ -170,6 +170,15 @@ class TestStructuredJsonFormatter:
         for noise_field in ("pathname", "lineno", "funcName", "processName", "threadName"):
             assert noise_field not in parsed
 
+    def test_values_orjson_rejects_still_logged(self) -> None:
+        """Lone surrogates and >64-bit ints fall back to stdlib json."""
+        fmt = StructuredJsonFormatter()
+        record = _make_record(extra={"filename_raw": "spec\udcff.fits", "big": 2**70})
+        parsed = _format_and_parse(fmt, record)
+
+        assert parsed["filename_raw"] == "spec\udcff.fits"
+        assert parsed["big"] == 2**70
+
 
 class TestLogContext:
     """Tests for LogContext."""